@@ -0,0 +1,177 @@
+"""
+Sensor line parsers for MIZU Sensor Hub.
+
+These functions turn one stripped raw sensor line (bytes) into a dict of
+SensorData column values. They are kept free of application state and
+fully annotated so the module can be compiled with mypyc:
+
+    mypyc _parse_fast.py
+
+The compiled extension is picked up automatically by ``import _parse_fast``;
+without it the module runs as plain Python.
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+# orjson parses small JSON payloads several times faster than the stdlib
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads  # type: ignore[assignment]
+
+# Numbers in free-form sensor lines, e.g. b"-12", b"3.5" or b"7."
+_NUMBER_RE = re.compile(rb'-?\d+\.?\d*')
+
+# One key=value pair of the key-value format (bytes); values run to the next comma
+_KV_RE = re.compile(rb'([^,=]+)=([^,]*)')
+
+# SensorData columns filled from JSON payloads, paired with their JSON keys
+_JSON_FIELDS = (
+    ('ambient_temperature', 'ambient_temp'),
+    ('humidity', 'humidity'),
+    ('soil_moisture', 'soil_moisture'),
+    ('soil_temperature', 'soil_temp'),
+    ('wind_speed', 'wind_speed'),
+    ('ambient_light', 'ambient_light'),
+    ('uv_light', 'uv_light')
+)
+
+# Key-value field names (lowercase) mapped to SensorData columns. Both the
+# short wire names and the long names used by the JSON format are accepted.
+_KEY_MAP = {
+    b'd_id': 'device_id', b'device_id': 'device_id',
+    b'a_t': 'ambient_temperature', b'ambient_temp': 'ambient_temperature',
+    b'hum': 'humidity', b'humidity': 'humidity',
+    b's_m': 'soil_moisture', b'soil_moisture': 'soil_moisture',
+    b's_t': 'soil_temperature', b'soil_temp': 'soil_temperature',
+    b'w_s': 'wind_speed', b'wind_speed': 'wind_speed',
+    b'a_l': 'ambient_light', b'ambient_light': 'ambient_light',
+    b'uv_l': 'uv_light', b'uv_light': 'uv_light'
+}
+
+
+def parse_sensor_line(data: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse a stripped sensor data line in any supported format.
+
+    Args:
+        data: Stripped raw sensor data line
+
+    Returns:
+        Dictionary with parsed sensor data or None if parsing fails
+    """
+    # Try to parse JSON-like format
+    if data[:1] == b'{' and data[-1:] == b'}':
+        return parse_json_format(data)
+
+    # Try to parse key-value format (check before CSV since key-value also contains commas)
+    if b'=' in data:
+        return parse_key_value_format(data)
+
+    # Try to parse CSV-like format
+    if b',' in data:
+        return parse_csv_format(data)
+
+    # If no specific format detected, try to extract numbers
+    return parse_generic_format(data)
+
+
+def parse_json_format(data: bytes) -> Optional[Dict[str, Any]]:
+    """Parse JSON-like format data."""
+    try:
+        # Both orjson and json accept bytes, so there is no decode step
+        payload = _loads(data)
+
+        get = payload.get
+        sensor_data: Dict[str, Any] = {'device_id': str(get('device_id', 'unknown'))}
+        for column, key in _JSON_FIELDS:
+            # JSON numbers with a fraction already decode to float
+            value = get(key)
+            sensor_data[column] = value if value.__class__ is float else safe_float(value)
+        sensor_data['transmitted'] = False
+        return sensor_data
+    except Exception:
+        return None
+
+
+def parse_csv_format(data: bytes) -> Optional[Dict[str, Any]]:
+    """Parse CSV-like format data."""
+    try:
+        # float() accepts bytes, so only the device ID is decoded
+        parts = data.split(b',')
+        if len(parts) >= 5:
+            return {
+                'device_id': parts[0].strip().decode('utf-8', errors='replace'),
+                'ambient_temperature': safe_float(parts[1]),
+                'humidity': safe_float(parts[2]),
+                'soil_moisture': safe_float(parts[3]),
+                'soil_temperature': safe_float(parts[4]),
+                'wind_speed': safe_float(parts[5]) if len(parts) > 5 else None,
+                'ambient_light': safe_float(parts[6]) if len(parts) > 6 else None,
+                'uv_light': safe_float(parts[7]) if len(parts) > 7 else None,
+                'transmitted': False
+            }
+    except Exception:
+        pass
+    return None
+
+
+def parse_key_value_format(data: bytes) -> Optional[Dict[str, Any]]:
+    """Parse key=value format data."""
+    try:
+        device_id: Optional[bytes] = None
+        sensor_data: Dict[str, Any] = {}
+        for match in _KV_RE.finditer(data):
+            # Unknown keys are dropped; float() ignores the whitespace left
+            # around values
+            column = _KEY_MAP.get(match.group(1).strip().lower())
+            if column is None:
+                continue
+            if column == 'device_id':
+                device_id = match.group(2)
+            else:
+                sensor_data[column] = safe_float(match.group(2))
+
+        # Check if we have at least a device_id and some sensor data
+        if device_id is not None and sensor_data:
+            sensor_data['device_id'] = device_id.strip().decode('utf-8', errors='replace')
+            sensor_data['transmitted'] = False
+            return sensor_data
+
+    except Exception:
+        pass
+    return None
+
+
+def parse_generic_format(data: bytes) -> Optional[Dict[str, Any]]:
+    """Parse generic format by extracting numbers."""
+    try:
+        # Extract all numbers from the line
+        numbers = _NUMBER_RE.findall(data)
+
+        if len(numbers) >= 4:
+            return {
+                'device_id': 'unknown',
+                'ambient_temperature': safe_float(numbers[0]),
+                'humidity': safe_float(numbers[1]),
+                'soil_moisture': safe_float(numbers[2]),
+                'soil_temperature': safe_float(numbers[3]),
+                'wind_speed': safe_float(numbers[4]) if len(numbers) > 4 else None,
+                'ambient_light': safe_float(numbers[5]) if len(numbers) > 5 else None,
+                'uv_light': safe_float(numbers[6]) if len(numbers) > 6 else None,
+                'transmitted': False
+            }
+    except Exception:
+        pass
+    return None
+
+
+def safe_float(value: Any) -> Optional[float]:
+    """Safely convert value to float."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
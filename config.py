@@ -5,6 +5,8 @@ This module contains all application constants, configuration settings,
 and default values used throughout the application.
 """
 
+import os
+
 # Application window configuration
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 500
@@ -13,7 +15,16 @@ WINDOW_TITLE = "MIZU Sensor Hub"
 # Serial communication configuration
 DEFAULT_BAUD_RATE = "9600"
 SERIAL_TIMEOUT = 0.1
-MAX_COM_PORTS = 256
+SERIAL_RX_BUFFER_SIZE = 65536  # Driver receive buffer requested on Windows, in bytes
+
+# Linux only, off by default: CPU the serial monitor thread is pinned to, and
+# the SCHED_FIFO priority (1-99) it runs at so a busy system cannot delay reads.
+# To enable, set a CPU number such as 1 and a priority such as 10; the priority
+# needs CAP_SYS_NICE, for example running as root or under a systemd unit with
+# AmbientCapabilities=CAP_SYS_NICE.
+# None leaves the thread's default.
+SERIAL_MONITOR_CPU = None
+SERIAL_MONITOR_RT_PRIORITY = None
 
 # UI Configuration
 DEFAULT_THEME = "Light"
@@ -25,6 +36,12 @@ TITLE_FONT_SIZE = 22
 ICON_FONT = "Segoe UI Emoji"
 ICON_FONT_SIZE = 28
 
+# Received-data display
+DISPLAY_REFRESH_INTERVAL_MS = 33  # Pending lines are painted at most this often (~30 Hz)
+DISPLAY_MAX_PENDING_LINES = 2000  # Oldest unpainted lines are dropped beyond this
+DISPLAY_MAX_LINES = 5000  # Older lines are removed from the display
+DISPLAY_TRIM_INTERVAL = 100  # Refreshes between checks for lines beyond DISPLAY_MAX_LINES
+
 # Colors
 ICON_COLOR = "#006400"  # Dark green
 TITLE_COLOR = "#1f538d"  # Blue
@@ -48,10 +65,10 @@ ERROR_MESSAGES = {
     "unsupported_platform": "Unsupported platform detected"
 }
 
-# Success messages
+# Success messages, logged with %-style arguments
 SUCCESS_MESSAGES = {
     "connection_closed": "Serial connection successfully closed",
-    "command_sent": "Command sent successfully: {command}"
+    "command_sent": "Command sent successfully: %s"
 }
 
 # Dialog titles
@@ -73,7 +90,57 @@ DATABASE_CONFIG = {
 }
 
 # Database URL template
-DATABASE_URL_TEMPLATE = "postgresql://{username}:{password}@{host}:{port}/{database}"
+DATABASE_URL_TEMPLATE = "postgresql+psycopg://{username}:{password}@{host}:{port}/{database}"
+
+# Database URL built from DATABASE_CONFIG
+DATABASE_URL = DATABASE_URL_TEMPLATE.format(**DATABASE_CONFIG)
+
+# Database connection pool settings passed to create_engine. Writes come from
+# one flusher thread, so a single connection is kept open; bulk imports and
+# other occasional users borrow up to three more that are closed after use.
+DATABASE_POOL_CONFIG = {
+    "pool_size": 1,
+    "max_overflow": 3,
+    "pool_pre_ping": True,  # Replace connections the server has dropped
+    "pool_recycle": 1800,  # Seconds before a connection is reopened
+    "pool_use_lifo": True  # Reuse the most recently returned (warm) connection
+}
+
+# libpq options for every pooled connection. TCP keepalives stop idle
+# firewalls and NAT gateways from silently dropping connections between flushes,
+# and the connect timeout bounds how long an unreachable server blocks a write.
+DATABASE_CONNECT_ARGS = {
+    "connect_timeout": 5,  # Seconds to wait for a new connection
+    "keepalives": 1,
+    "keepalives_idle": 30,  # Idle seconds before the first probe
+    "keepalives_interval": 10,  # Seconds between unanswered probes
+    "keepalives_count": 3  # Unanswered probes before the connection is dropped
+}
+
+# Store sensor partitions as UNLOGGED tables (set MIZU_UNLOGGED=1). Writes skip
+# the WAL and are noticeably faster, but the data is truncated after a crash and
+# is not replicated, so only use this for development and CI databases.
+DATABASE_UNLOGGED = os.environ.get("MIZU_UNLOGGED") == "1"
+
+# Monthly sensor table partitions to keep created ahead of the current month
+DATABASE_PARTITION_MONTHS_AHEAD = 1
+
+# Database write batching
+DATABASE_BATCH_SIZE = 1000  # Rows per flush; reaching it wakes the flusher early
+DATABASE_FLUSH_INTERVAL = 1.0  # Seconds between flushes
+DATABASE_BUFFER_SIZE = 10000  # Max buffered rows; oldest are dropped when full
+DATABASE_COPY_THRESHOLD = 50  # Flushes at least this large use COPY instead of INSERT
+DATABASE_USE_PIPELINE = True  # Send small-flush INSERTs in one psycopg pipeline round-trip
+DATABASE_CLOSE_TIMEOUT = 5.0  # Seconds close() waits for the flusher's last write
+
+# Bulk imports of at least this many rows drop the sensor table's secondary
+# indexes and rebuild them once afterwards, using this much maintenance memory
+DATABASE_BULK_IMPORT_THRESHOLD = 100000
+DATABASE_BULK_IMPORT_WORK_MEM = "512MB"
+
+# Logging configuration
+LOG_LEVEL = "INFO"
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
 
 # Exit confirmation message
 EXIT_CONFIRMATION_MESSAGE = "Are you sure you want to exit the MIZU Sensor Hub?"
@@ -3,11 +3,146 @@ Database manager for MIZU Sensor Hub.
 
 This module handles all database operations including saving sensor data
 and managing database connections.
+
+Received lines are buffered in memory, then parsed and written in
+batches by a background flusher thread, so the serial thread neither
+parses nor waits on the database.
 """
 
-import re
-from typing import Optional, Dict, Any
-from database_models import SensorData, get_db_session, init_database
+import logging
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
+import psycopg
+from sqlalchemy import exc, insert, text
+from sqlalchemy.orm import Session
+
+from config import (
+    DATABASE_BATCH_SIZE, DATABASE_FLUSH_INTERVAL, DATABASE_BUFFER_SIZE,
+    DATABASE_COPY_THRESHOLD, DATABASE_USE_PIPELINE, DATABASE_CLOSE_TIMEOUT,
+    DATABASE_BULK_IMPORT_THRESHOLD, DATABASE_BULK_IMPORT_WORK_MEM
+)
+from database_models import (
+    SensorData, create_session, ensure_partitions, get_engine, init_database,
+    load_device_refs, register_devices
+)
+from _parse_fast import parse_sensor_line
+
+logger = logging.getLogger(__name__)
+
+# Column order of the write path. Rows are buffered as tuples in this order,
+# holding the device identifier in the device_ref slot until they are written.
+_COLUMNS = (
+    'device_ref', 'ambient_temperature', 'humidity', 'soil_moisture',
+    'soil_temperature', 'wind_speed', 'ambient_light', 'uv_light',
+    'transmitted', 'timestamp'
+)
+# Postgres types of _COLUMNS, needed to encode rows for binary COPY
+_COPY_TYPES = (
+    'int2', 'float4', 'float4', 'float4',
+    'float4', 'float4', 'float4', 'float4',
+    'bool', 'timestamp'
+)
+# Binary COPY skips formatting values as text and parsing them on the server
+_COPY_SQL = (
+    f"COPY {SensorData.__tablename__} ({', '.join(_COLUMNS)}) FROM STDIN (FORMAT BINARY)"
+)
+_INSERT_SQL = (
+    f"INSERT INTO {SensorData.__tablename__} ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(_COLUMNS))})"
+)
+
+
+# Largest finite value a REAL (float4) column can hold
+_FLOAT4_MAX = 3.4028234663852886e38
+
+# Errors caused by the values of a row, which retrying the batch without that
+# row can fix. Anything else, such as a lost connection, a missing column or a
+# read-only standby, fails every row alike.
+_ROW_ERRORS = (
+    psycopg.DataError, psycopg.IntegrityError,
+    exc.DataError, exc.IntegrityError
+)
+
+
+def _clean_device_id(device_id: Any) -> str:
+    """
+    Make a device identifier storable in the devices table.
+
+    Postgres text cannot contain NUL characters, so they are removed.
+
+    Args:
+        device_id: Device identifier from parsed sensor data
+
+    Returns:
+        Device identifier, or 'unknown' if none is left
+    """
+    if device_id.__class__ is not str:
+        device_id = '' if device_id is None else str(device_id)
+    if '\x00' in device_id:
+        device_id = device_id.replace('\x00', '')
+    return device_id or 'unknown'
+
+
+def _clean_value(value: Any) -> Optional[float]:
+    """
+    Make a sensor reading storable in a REAL column.
+
+    Args:
+        value: Sensor reading from parsed sensor data
+
+    Returns:
+        The reading as a float, or None if it is not a number or too
+        large for float4
+    """
+    if value.__class__ is float and -_FLOAT4_MAX <= value <= _FLOAT4_MAX:
+        return value
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    # NaN and infinity are valid REAL values; only finite overflow is not
+    if math.isfinite(value) and abs(value) > _FLOAT4_MAX:
+        return None
+    return value
+
+
+def _row_tuple(sensor_data: Dict[str, Any], timestamp: Optional[datetime] = None) -> Tuple[Any, ...]:
+    """
+    Build the buffered row for parsed sensor data.
+
+    Values are cleaned up front, so that a bad reading can neither fail
+    the batch it is written in nor register a junk device.
+
+    Args:
+        sensor_data: Parsed sensor data dictionary
+        timestamp: Time of the reading; defaults to now
+
+    Returns:
+        Tuple of column values in _COLUMNS order
+    """
+    get = sensor_data.get
+    return (
+        _clean_device_id(get('device_id')),
+        _clean_value(get('ambient_temperature')), _clean_value(get('humidity')),
+        _clean_value(get('soil_moisture')), _clean_value(get('soil_temperature')),
+        _clean_value(get('wind_speed')), _clean_value(get('ambient_light')),
+        _clean_value(get('uv_light')),
+        bool(get('transmitted', False)), timestamp or datetime.utcnow()
+    )
+
+
+# Seconds between checks that upcoming monthly partitions exist
+_PARTITION_CHECK_INTERVAL = 3600.0
+
+# Distinct raw lines whose parse results are memoized
+_PARSE_CACHE_SIZE = 4096
 
 
 class DatabaseManager:
@@ -28,198 +163,486 @@ class DatabaseManager:
         self.database_url = database_url
         self._initialized = False
 
+        # (receive time, raw line) pairs waiting to be parsed and written, oldest first
+        self._buffer: deque = deque(maxlen=DATABASE_BUFFER_SIZE)
+        # Lines discarded because the buffer was full, and how many of those were logged
+        self._dropped_rows = 0
+        self._reported_drops = 0
+        self._flush_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flusher_thread: Optional[threading.Thread] = None
+        self._session: Optional[Session] = None
+        # Built once so every small flush hits SQLAlchemy's compiled statement cache
+        self._insert_stmt = insert(SensorData)
+
+        # devices.id for each device identifier, filled on startup and on new devices
+        self._device_refs: Dict[str, int] = {}
+
     def initialize(self) -> bool:
         """
         Initialize the database connection and create tables.
 
+        Also starts the background flusher thread.
+
         Returns:
             True if initialization successful, False otherwise
         """
         try:
             init_database(self.database_url)
+            self._device_refs = load_device_refs()
             self._initialized = True
-            print(f"Database initialized successfully: {self.database_url}")
+            self._start_flusher()
+            logger.info(
+                "Database initialized: %s", get_engine().url.render_as_string(hide_password=True)
+            )
             return True
-        except Exception as e:
-            print(f"Failed to initialize database: {e}")
+        except Exception:
+            logger.exception("Failed to initialize database")
             return False
 
-    def save_sensor_data(self, data_string: str) -> bool:
+    def save_sensor_data(self, data: Union[bytes, str]) -> bool:
         """
-        Parse sensor data from string and save to database.
+        Queue a sensor data line for saving.
+
+        The line is parsed and written by the flusher thread on its next
+        flush; this method only timestamps and buffers it.
 
         Args:
-            data_string: Raw sensor data string from serial connection
+            data: Raw sensor data line from serial connection, as bytes or text
 
         Returns:
-            True if data saved successfully, False otherwise
+            True if the line was queued, False otherwise
         """
         if not self._initialized:
-            print("Database not initialized. Cannot save data.")
+            logger.debug("Database not initialized. Cannot save data.")
             return False
 
-        try:
-            # Parse the sensor data
-            sensor_data = self._parse_sensor_data(data_string)
-            if not sensor_data:
-                return False
-
-            # Save to database
-            db = get_db_session()
-            try:
-                new_record = SensorData(**sensor_data)
-                db.add(new_record)
-                db.commit()
-                print(f"Saved sensor data to database: {sensor_data}")
-                return True
-            except Exception as e:
-                db.rollback()
-                print(f"Failed to save sensor data: {e}")
-                return False
-            finally:
-                db.close()
-
-        except Exception as e:
-            print(f"Error processing sensor data: {e}")
-            return False
+        # When the database falls behind, the buffer bounds memory use:
+        # appending to a full deque discards the oldest line
+        buffer = self._buffer
+        if len(buffer) == DATABASE_BUFFER_SIZE:
+            self._dropped_rows += 1
 
-    def _parse_sensor_data(self, data_string: str) -> Optional[Dict[str, Any]]:
+        # Stamp the reading when it is received, not when it is flushed
+        buffer.append((datetime.utcnow(), data))
+
+        # While the flusher is busy writing, the event stays set; checking it
+        # first keeps the serial thread off the event's lock for every line
+        wake_event = self._wake_event
+        if len(buffer) >= DATABASE_BATCH_SIZE and not wake_event.is_set():
+            wake_event.set()
+        return True
+
+    def flush(self) -> int:
         """
-        Parse sensor data from the received string.
+        Parse and write all buffered sensor data to the database.
 
-        This method attempts to extract sensor values from various
-        common data formats. You may need to adjust the parsing logic
-        based on your specific sensor data format.
+        Lines that cannot be parsed are skipped.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        with self._flush_lock:
+            dropped = self._dropped_rows - self._reported_drops
+            if dropped:
+                self._reported_drops += dropped
+                logger.warning("Sensor data buffer full, dropped %d oldest lines", dropped)
+
+            buffer = self._buffer
+            while buffer:
+                lines = [buffer.popleft() for _ in range(min(len(buffer), DATABASE_BATCH_SIZE))]
+                rows = [row for row in map(self._parse_row, lines) if row is not None]
+
+                if rows:
+                    written += self._write_rows(rows)
+        return written
+
+    def bulk_import(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write a large batch of sensor data directly, bypassing the buffer.
+
+        Meant for one-off imports, such as replaying readings a sensor
+        stored while it was disconnected. All rows are streamed with COPY
+        in one transaction. From DATABASE_BULK_IMPORT_THRESHOLD rows on,
+        the device and timestamp indexes are dropped first and rebuilt
+        once at the end, which is much faster than updating them for
+        every row. A failed import leaves the table unchanged.
+
+        Dropping the indexes takes an ACCESS EXCLUSIVE lock on the sensor
+        table until the import commits, which blocks readers as well as
+        writers. The flusher then stalls too, so live serial readings
+        beyond DATABASE_BUFFER_SIZE are dropped while a large import
+        runs. Smaller imports take no such lock and run alongside the
+        flusher.
 
         Args:
-            data_string: Raw sensor data string
+            records: Parsed sensor data dictionaries; records without a
+                timestamp are stamped with the import time. Records
+                without a device_id, or whose timestamp is not a
+                datetime, are skipped.
 
         Returns:
-            Dictionary with parsed sensor data or None if parsing fails
+            Number of rows written
         """
-        # Remove whitespace and newlines
-        data_string = data_string.strip()
+        if not self._initialized:
+            logger.debug("Database not initialized. Cannot import data.")
+            return 0
+
+        now = datetime.utcnow()
+        batch = []
+        skipped = 0
+        for record in records:
+            timestamp = record.get('timestamp') or now
+            if not record.get('device_id') or not isinstance(timestamp, datetime):
+                skipped += 1
+                continue
+            batch.append(_row_tuple(record, timestamp))
+
+        if skipped:
+            logger.warning(
+                "Skipped %d sensor data records without a device_id or valid timestamp", skipped
+            )
+        if not batch:
+            return 0
+
+        indexes = []
+        if len(batch) >= DATABASE_BULK_IMPORT_THRESHOLD:
+            # The primary key stays, since Postgres needs it to check uniqueness
+            indexes = list(SensorData.__table__.indexes)
 
-        # Try to parse JSON-like format
-        if data_string.startswith('{') and data_string.endswith('}'):
-            return self._parse_json_format(data_string)
+        try:
+            # The flusher shares the device refs, but not the import's transaction
+            with self._flush_lock:
+                refs = self._resolve_device_refs(batch)
 
-        # Try to parse key-value format (check before CSV since key-value also contains commas)
-        if '=' in data_string:
-            return self._parse_key_value_format(data_string)
+            with get_engine().begin() as connection:
+                for index in indexes:
+                    index.drop(connection)
 
-        # Try to parse CSV-like format
-        if ',' in data_string:
-            return self._parse_csv_format(data_string)
+                self._copy_to(connection.connection.driver_connection, refs)
 
-        # If no specific format detected, try to extract numbers
-        return self._parse_generic_format(data_string)
+                if indexes:
+                    connection.execute(text(
+                        f"SET LOCAL maintenance_work_mem = '{DATABASE_BULK_IMPORT_WORK_MEM}'"
+                    ))
+                    for index in indexes:
+                        index.create(connection)
 
-    def _parse_json_format(self, data_string: str) -> Optional[Dict[str, Any]]:
-        """Parse JSON-like format data."""
-        try:
-            import json
-            data = json.loads(data_string)
-
-            return {
-                'device_id': str(data.get('device_id', 'unknown')),
-                'ambient_temperature': self._safe_float(data.get('ambient_temp')),
-                'humidity': self._safe_float(data.get('humidity')),
-                'soil_moisture': self._safe_float(data.get('soil_moisture')),
-                'soil_temperature': self._safe_float(data.get('soil_temp')),
-                'wind_speed': self._safe_float(data.get('wind_speed')),
-                'ambient_light': self._safe_float(data.get('ambient_light')),
-                'uv_light': self._safe_float(data.get('uv_light')),
-                'transmitted': False
-            }
+            logger.info("Imported %d sensor data rows", len(batch))
+            return len(batch)
         except Exception:
-            return None
+            logger.exception("Failed to import %d sensor data rows", len(batch))
+            return 0
+
+    def close(self) -> None:
+        """
+        Stop the flusher thread and write any remaining buffered data.
+
+        The flusher is given DATABASE_CLOSE_TIMEOUT seconds to finish its
+        last write. If it is still busy after that, for example because
+        the database is unreachable, the remaining lines are abandoned so
+        that closing the application does not hang. Lines saved
+        afterwards are refused. Calling close() again does nothing.
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+
+        flusher_thread = self._flusher_thread
+        self._flusher_thread = None
+        if flusher_thread:
+            flusher_thread.join(DATABASE_CLOSE_TIMEOUT)
+            if flusher_thread.is_alive():
+                logger.warning(
+                    "Database writes did not finish within %.1f seconds, "
+                    "abandoning %d buffered lines", DATABASE_CLOSE_TIMEOUT, len(self._buffer)
+                )
+                # The flusher is still using the session, so it is left open
+                self._initialized = False
+                return
+
+        if self._initialized:
+            self.flush()
+            self._initialized = False
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _start_flusher(self) -> None:
+        """
+        Start the background flusher thread.
+        """
+        if self._flusher_thread and self._flusher_thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._flusher_thread = threading.Thread(target=self._flush_periodically)
+        self._flusher_thread.daemon = True
+        self._flusher_thread.start()
 
-    def _parse_csv_format(self, data_string: str) -> Optional[Dict[str, Any]]:
-        """Parse CSV-like format data."""
+    def _flush_periodically(self) -> None:
+        """
+        Flush the buffer every flush interval, or sooner when a full batch is waiting.
+
+        Upcoming monthly partitions are also checked once per partition
+        check interval.
+
+        This method runs in a separate thread until close() is called.
+        """
+        # initialize() already created this month's partitions
+        next_partition_check = time.monotonic() + _PARTITION_CHECK_INTERVAL
+
+        while not self._stop_event.is_set():
+            self._wake_event.wait(DATABASE_FLUSH_INTERVAL)
+            self._wake_event.clear()
+
+            if time.monotonic() >= next_partition_check:
+                self._ensure_partitions()
+                next_partition_check = time.monotonic() + _PARTITION_CHECK_INTERVAL
+
+            self.flush()
+
+    def _ensure_partitions(self) -> None:
+        """
+        Pre-create upcoming monthly partitions so new rows never fall into the default one.
+        """
         try:
-            parts = data_string.split(',')
-            if len(parts) >= 5:
-                return {
-                    'device_id': str(parts[0].strip()),
-                    'ambient_temperature': self._safe_float(parts[1]),
-                    'humidity': self._safe_float(parts[2]),
-                    'soil_moisture': self._safe_float(parts[3]),
-                    'soil_temperature': self._safe_float(parts[4]),
-                    'wind_speed': self._safe_float(parts[5]) if len(parts) > 5 else None,
-                    'ambient_light': self._safe_float(parts[6]) if len(parts) > 6 else None,
-                    'uv_light': self._safe_float(parts[7]) if len(parts) > 7 else None,
-                    'transmitted': False
-                }
+            ensure_partitions()
         except Exception:
-            pass
-        return None
+            logger.exception("Failed to create sensor data partitions")
+
+    def _write_rows(self, rows: List[Tuple[Any, ...]]) -> int:
+        """
+        Write a batch of parsed rows in a single transaction.
+
+        Devices seen for the first time are registered first. Large
+        batches are then streamed with COPY; small ones use a Core
+        INSERT, which has less setup overhead.
+
+        If a row's values are rejected, the batch is split in halves that
+        are retried on their own, so a single bad row only loses itself.
+        Any other error loses the whole batch, since retrying smaller
+        batches cannot help.
+
+        Args:
+            rows: Buffered row tuples
 
-    def _parse_key_value_format(self, data_string: str) -> Optional[Dict[str, Any]]:
-        """Parse key=value format data."""
+        Returns:
+            Number of rows written
+        """
         try:
-            data = {}
-            pairs = data_string.split(',')
-
-            for pair in pairs:
-                if '=' in pair:
-                    key, value = pair.split('=', 1)
-                    key = key.strip().lower()
-                    value = value.strip()
-
-                    if key == 'd_id':
-                        data['device_id'] = value
-                    elif key == 'a_t':
-                        data['ambient_temperature'] = self._safe_float(value)
-                    elif key == 'hum':
-                        data['humidity'] = self._safe_float(value)
-                    elif key == 's_m':
-                        data['soil_moisture'] = self._safe_float(value)
-                    elif key == 's_t':
-                        data['soil_temperature'] = self._safe_float(value)
-                    elif key == 'w_s':
-                        data['wind_speed'] = self._safe_float(value)
-                    elif key == 'a_l':
-                        data['ambient_light'] = self._safe_float(value)
-                    elif key == 'uv_l':
-                        data['uv_light'] = self._safe_float(value)
-
-            # Check if we have at least a device_id and some sensor data
-            if 'device_id' in data and any(key in data for key in ['ambient_temperature', 'humidity', 'soil_moisture', 'soil_temperature', 'wind_speed', 'ambient_light', 'uv_light']):
-                data['transmitted'] = False
-                return data
+            refs = self._resolve_device_refs(rows)
+            if len(refs) >= DATABASE_COPY_THRESHOLD:
+                self._copy_rows(refs)
+            else:
+                self._insert_rows(refs)
+            logger.debug("Saved %d sensor data rows", len(refs))
+            return len(refs)
+        except _ROW_ERRORS:
+            if len(rows) == 1:
+                logger.exception("Dropping sensor data row the database rejected: %r", rows[0])
+                return 0
+        except Exception:
+            logger.exception("Failed to save %d sensor data rows", len(rows))
+            return 0
 
+        logger.warning("Failed to save %d sensor data rows, retrying in halves", len(rows))
+        middle = len(rows) // 2
+        return self._write_rows(rows[:middle]) + self._write_rows(rows[middle:])
+
+    def _resolve_device_refs(self, rows: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+        """
+        Swap the device identifier of each row for its device_ref.
+
+        Unknown devices are registered in one round-trip.
+
+        Returns:
+            Rows ready to be written
+        """
+        device_refs = self._device_refs
+        missing = {row[0] for row in rows if row[0] not in device_refs}
+        if missing:
+            device_refs.update(register_devices(missing))
+
+        return [(device_refs[row[0]],) + row[1:] for row in rows]
+
+    def _copy_rows(self, rows: List[Tuple[Any, ...]]) -> None:
+        """Stream rows into the table with a binary COPY ... FROM STDIN."""
+        connection = get_engine().raw_connection()
+        try:
+            self._copy_to(connection.driver_connection, rows)
+            connection.commit()
         except Exception:
-            pass
-        return None
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _copy_to(pg_connection, rows: List[Tuple[Any, ...]]) -> None:
+        """Run COPY on a psycopg connection, leaving the transaction open."""
+        with pg_connection.cursor() as cursor:
+            with cursor.copy(_COPY_SQL) as copy:
+                copy.set_types(_COPY_TYPES)
+                for row in rows:
+                    copy.write_row(row)
+
+    def _insert_rows(self, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Insert rows with an executemany INSERT.
+
+        With DATABASE_USE_PIPELINE the statements are sent in a single
+        psycopg pipeline; otherwise a Core insert is used. Neither path
+        builds SensorData objects.
+        """
+        if DATABASE_USE_PIPELINE:
+            self._insert_rows_pipelined(rows)
+            return
+
+        parameters = [dict(zip(_COLUMNS, row)) for row in rows]
 
-    def _parse_generic_format(self, data_string: str) -> Optional[Dict[str, Any]]:
-        """Parse generic format by extracting numbers."""
+        # One session is reused for every flush; begin() checks a pooled
+        # connection out for the transaction and returns it on commit
+        if self._session is None:
+            self._session = create_session()
+        with self._session.begin():
+            self._session.execute(self._insert_stmt, parameters)
+
+    def _insert_rows_pipelined(self, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Insert rows in psycopg pipeline mode, with one network round-trip per flush.
+
+        psycopg prepares executemany statements on the server and keeps
+        them per connection, so pooled connections skip re-planning the
+        INSERT on later flushes.
+        """
+        connection = get_engine().raw_connection()
         try:
-            # Extract all numbers from the string
-            numbers = re.findall(r'-?\d+\.?\d*', data_string)
-
-            if len(numbers) >= 4:
-                return {
-                    'device_id': 'unknown',
-                    'ambient_temperature': self._safe_float(numbers[0]),
-                    'humidity': self._safe_float(numbers[1]),
-                    'soil_moisture': self._safe_float(numbers[2]),
-                    'soil_temperature': self._safe_float(numbers[3]),
-                    'wind_speed': self._safe_float(numbers[4]) if len(numbers) > 4 else None,
-                    'ambient_light': self._safe_float(numbers[5]) if len(numbers) > 5 else None,
-                    'uv_light': self._safe_float(numbers[6]) if len(numbers) > 6 else None,
-                    'transmitted': False
-                }
+            pg_connection = connection.driver_connection
+            with pg_connection.pipeline(), pg_connection.cursor() as cursor:
+                cursor.executemany(_INSERT_SQL, rows)
+            connection.commit()
         except Exception:
-            pass
-        return None
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def get_write_stats(self) -> Dict[str, int]:
+        """
+        Get the state of the write buffer.
+
+        Returns:
+            Dictionary with the number of lines waiting to be written and
+            the total number of lines dropped because the buffer was full
+        """
+        return {
+            'buffered': len(self._buffer),
+            'dropped': self._dropped_rows
+        }
+
+    def get_parse_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics for the parsed-line cache.
+
+        Returns:
+            Dictionary with hits, misses, current size and hit rate
+        """
+        info = self._parse_cached.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0
+        }
+
+    def _parse_row(self, line: Tuple[datetime, Union[bytes, str]]) -> Optional[Tuple[Any, ...]]:
+        """
+        Parse a buffered line into a row tuple.
+
+        Args:
+            line: (receive time, raw sensor data line) pair
 
-    def _safe_float(self, value) -> Optional[float]:
-        """Safely convert value to float."""
-        if value is None:
+        Returns:
+            Row tuple in _COLUMNS order, or None if parsing fails
+        """
+        received_at, data = line
+        if isinstance(data, str):
+            data = data.encode('utf-8', errors='ignore')
+
+        # The cached dict is only read here, so it needs no copy
+        sensor_data = self._parse_cached(data.strip())
+        if sensor_data is None:
+            logger.debug("Skipping unparsable sensor data: %r", data)
             return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
+        return _row_tuple(sensor_data, received_at)
+
+    def _parse_sensor_data(self, data: Union[bytes, str]) -> Optional[Dict[str, Any]]:
+        """
+        Parse sensor data from the received line.
+
+        This method attempts to extract sensor values from various
+        common data formats. You may need to adjust the parsing logic
+        based on your specific sensor data format.
+
+        Args:
+            data: Raw sensor data line, as bytes or text
+
+        Returns:
+            Dictionary with parsed sensor data or None if parsing fails
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8', errors='ignore')
+
+        # Remove whitespace and newlines so repeated lines share a cache entry
+        parsed = self._parse_cached(data.strip())
+        if parsed is None:
             return None
+
+        # The cached dict is shared between calls, so hand out a copy
+        sensor_data = dict(parsed)
+        sensor_data['transmitted'] = False
+        return sensor_data
+
+    def _parse_sensor_data_batch(self, lines: Iterable[Union[bytes, str]]) -> List[Dict[str, Any]]:
+        """
+        Parse many sensor data lines in one call.
+
+        Equivalent to calling _parse_sensor_data() on each line, but with
+        the per-call lookups hoisted out of the loop.
+
+        Args:
+            lines: Raw sensor data lines, as bytes or text
+
+        Returns:
+            Dictionaries with parsed sensor data, in input order; lines that
+            cannot be parsed are left out
+        """
+        parse = self._parse_cached
+        parsed_lines = [
+            parse((line.encode('utf-8', errors='ignore') if isinstance(line, str) else line).strip())
+            for line in lines
+        ]
+
+        # The cached dicts are shared between calls, so hand out copies
+        return [dict(parsed, transmitted=False) for parsed in parsed_lines if parsed is not None]
+
+    @classmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _parse_cached(cls, data: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Parse a stripped sensor data line, memoized by its exact content.
+
+        Sensors often resend identical lines, so repeats skip parsing.
+        The returned dict must not be modified.
+
+        Args:
+            data: Stripped raw sensor data line
+
+        Returns:
+            Dictionary with parsed sensor data or None if parsing fails
+        """
+        return parse_sensor_line(data)
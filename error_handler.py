@@ -5,12 +5,60 @@ This module provides centralized error handling and user feedback
 mechanisms for the application.
 """
 
+from functools import lru_cache
 from tkinter import messagebox
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 from config import ERROR_MESSAGES, DIALOG_TITLES
 
 
+@lru_cache(maxsize=128)
+def _format(message_key: str, items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Look up and format an error message, memoized by key and parameters.
+
+    Args:
+        message_key: Key for the error message in ERROR_MESSAGES; unknown
+            keys are used as the message itself
+        items: Sorted (name, value) format parameters
+
+    Returns:
+        The formatted message
+    """
+    message = ERROR_MESSAGES.get(message_key, message_key)
+    if items:
+        message = message.format(**dict(items))
+    return message
+
+
+# Dialog title and message box for each kind of error
+_DISPATCH = {
+    'configuration': (DIALOG_TITLES["configuration_error"], messagebox.showerror),
+    'connection': (DIALOG_TITLES["connection_error"], messagebox.showerror),
+    'input': (DIALOG_TITLES["input_error"], messagebox.showwarning),
+    'communication': (DIALOG_TITLES["communication_error"], messagebox.showerror)
+}
+
+
+def _show(kind: str, message_key: str, **kwargs) -> None:
+    """
+    Show an error message in the dialog used for its kind of error.
+
+    Args:
+        kind: Kind of error, one of the keys of _DISPATCH
+        message_key: Key for the error message in ERROR_MESSAGES
+        **kwargs: Format parameters for the message
+    """
+    title, show_box = _DISPATCH[kind]
+    items = tuple(sorted(kwargs.items()))
+    try:
+        message = _format(message_key, items)
+    except TypeError:
+        # Unhashable parameters cannot be a cache key, so format them uncached
+        message = _format.__wrapped__(message_key, items)
+    show_box(title, message)
+
+
 class ErrorHandler:
     """
     Centralized error handling and user feedback.
@@ -19,6 +67,9 @@ class ErrorHandler:
     warnings, and success messages to users in a consistent manner.
     """
 
+    show = staticmethod(_show)
+
+    # One shortcut per kind of error, kept for existing callers
     @staticmethod
     def show_configuration_error(message_key: str, **kwargs) -> None:
         """
@@ -28,14 +79,7 @@ class ErrorHandler:
             message_key: Key for the error message in ERROR_MESSAGES
             **kwargs: Format parameters for the message
         """
-        message = ERROR_MESSAGES.get(message_key, message_key)
-        if kwargs:
-            message = message.format(**kwargs)
-
-        messagebox.showerror(
-            DIALOG_TITLES["configuration_error"],
-            message
-        )
+        _show('configuration', message_key, **kwargs)
 
     @staticmethod
     def show_connection_error(message_key: str, **kwargs) -> None:
@@ -46,14 +90,7 @@ class ErrorHandler:
             message_key: Key for the error message in ERROR_MESSAGES
             **kwargs: Format parameters for the message
         """
-        message = ERROR_MESSAGES.get(message_key, message_key)
-        if kwargs:
-            message = message.format(**kwargs)
-
-        messagebox.showerror(
-            DIALOG_TITLES["connection_error"],
-            message
-        )
+        _show('connection', message_key, **kwargs)
 
     @staticmethod
     def show_input_error(message_key: str, **kwargs) -> None:
@@ -64,14 +101,7 @@ class ErrorHandler:
             message_key: Key for the error message in ERROR_MESSAGES
             **kwargs: Format parameters for the message
         """
-        message = ERROR_MESSAGES.get(message_key, message_key)
-        if kwargs:
-            message = message.format(**kwargs)
-
-        messagebox.showwarning(
-            DIALOG_TITLES["input_error"],
-            message
-        )
+        _show('input', message_key, **kwargs)
 
     @staticmethod
     def show_communication_error(message_key: str, **kwargs) -> None:
@@ -82,14 +112,7 @@ class ErrorHandler:
             message_key: Key for the error message in ERROR_MESSAGES
             **kwargs: Format parameters for the message
         """
-        message = ERROR_MESSAGES.get(message_key, message_key)
-        if kwargs:
-            message = message.format(**kwargs)
-
-        messagebox.showerror(
-            DIALOG_TITLES["communication_error"],
-            message
-        )
+        _show('communication', message_key, **kwargs)
 
     @staticmethod
     def show_warning(title: str, message: str) -> None:
@@ -0,0 +1,35 @@
+"""Replace the timestamp B-tree index with a BRIN index
+
+Revision ID: 0003
+Revises: cb9daef77144
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = 'cb9daef77144'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap the timestamp B-tree for a BRIN index.
+
+    Rows are appended in timestamp order, so a BRIN index serves time range
+    scans at a fraction of the size and insert cost of a B-tree.
+    """
+    op.drop_index('ix_mizu_sensor_hub_timestamp', table_name='mizu_sensor_hub')
+    op.create_index(
+        'ix_mizu_sensor_hub_timestamp_brin', 'mizu_sensor_hub', ['timestamp'],
+        unique=False, postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade() -> None:
+    """Restore the timestamp B-tree index."""
+    op.drop_index('ix_mizu_sensor_hub_timestamp_brin', table_name='mizu_sensor_hub')
+    op.create_index('ix_mizu_sensor_hub_timestamp', 'mizu_sensor_hub', ['timestamp'], unique=False)
@@ -0,0 +1,115 @@
+"""Partition mizu_sensor_hub by month on timestamp
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    'id, device_id, ambient_temperature, humidity, soil_moisture, soil_temperature, '
+    'wind_speed, ambient_light, uv_light, transmitted, "timestamp"'
+)
+
+COLUMN_DEFINITIONS = """
+    id integer NOT NULL DEFAULT nextval('mizu_sensor_hub_id_seq'),
+    device_id varchar(100) NOT NULL,
+    ambient_temperature double precision,
+    humidity double precision,
+    soil_moisture double precision,
+    soil_temperature double precision,
+    wind_speed double precision,
+    ambient_light double precision,
+    uv_light double precision,
+    transmitted boolean NOT NULL,
+    "timestamp" timestamp without time zone NOT NULL
+"""
+
+
+def _next_month(month: datetime) -> datetime:
+    """Return the first day of the month after the given one."""
+    return datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    """Create the device and timestamp indexes on mizu_sensor_hub."""
+    op.create_index('ix_mizu_sensor_hub_device_id', 'mizu_sensor_hub', ['device_id'], unique=False)
+    op.create_index(
+        'ix_mizu_sensor_hub_timestamp_brin', 'mizu_sensor_hub', ['timestamp'],
+        unique=False, postgresql_using='brin', postgresql_with={'pages_per_range': 32}
+    )
+
+
+def _detach_table(name: str) -> None:
+    """Rename mizu_sensor_hub out of the way, along with its primary key and indexes."""
+    op.execute(f"ALTER TABLE mizu_sensor_hub RENAME TO {name}")
+    op.execute(f"ALTER TABLE {name} RENAME CONSTRAINT mizu_sensor_hub_pkey TO {name}_pkey")
+    op.drop_index('ix_mizu_sensor_hub_device_id', table_name=name)
+    op.drop_index('ix_mizu_sensor_hub_timestamp_brin', table_name=name)
+
+
+def upgrade() -> None:
+    """Rebuild mizu_sensor_hub as a table range-partitioned by month.
+
+    Existing rows are copied into monthly partitions named
+    mizu_sensor_hub_YYYY_MM, from the oldest reading through next month.
+    The id sequence is kept, so ids continue where they left off.
+    """
+    _detach_table('mizu_sensor_hub_unpartitioned')
+
+    op.execute(
+        f"CREATE TABLE mizu_sensor_hub ({COLUMN_DEFINITIONS}, "
+        'PRIMARY KEY (id, "timestamp")) PARTITION BY RANGE ("timestamp")'
+    )
+
+    oldest = op.get_bind().execute(sa.text(
+        'SELECT min("timestamp") FROM mizu_sensor_hub_unpartitioned'
+    )).scalar()
+    now = datetime.utcnow()
+    month = datetime((oldest or now).year, (oldest or now).month, 1)
+    last_month = _next_month(datetime(now.year, now.month, 1))
+
+    while month <= last_month:
+        next_month = _next_month(month)
+        op.execute(
+            f"CREATE TABLE mizu_sensor_hub_{month:%Y_%m} PARTITION OF mizu_sensor_hub "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')"
+        )
+        month = next_month
+    op.execute("CREATE TABLE mizu_sensor_hub_default PARTITION OF mizu_sensor_hub DEFAULT")
+
+    op.execute(
+        f"INSERT INTO mizu_sensor_hub ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM mizu_sensor_hub_unpartitioned"
+    )
+    op.execute("ALTER SEQUENCE mizu_sensor_hub_id_seq OWNED BY mizu_sensor_hub.id")
+    op.drop_table('mizu_sensor_hub_unpartitioned')
+
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Rebuild mizu_sensor_hub as a single unpartitioned table."""
+    _detach_table('mizu_sensor_hub_partitioned')
+
+    op.execute(f"CREATE TABLE mizu_sensor_hub ({COLUMN_DEFINITIONS}, PRIMARY KEY (id))")
+    op.execute(
+        f"INSERT INTO mizu_sensor_hub ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM mizu_sensor_hub_partitioned"
+    )
+    op.execute("ALTER SEQUENCE mizu_sensor_hub_id_seq OWNED BY mizu_sensor_hub.id")
+    # Dropping the partitioned table drops all of its partitions
+    op.drop_table('mizu_sensor_hub_partitioned')
+
+    _create_indexes()
@@ -0,0 +1,45 @@
+"""Store sensor measurements as real instead of double precision
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+MEASUREMENT_COLUMNS = (
+    'ambient_temperature', 'humidity', 'soil_moisture', 'soil_temperature',
+    'wind_speed', 'ambient_light', 'uv_light'
+)
+
+
+def _set_measurement_type(type_name: str) -> None:
+    """Change every measurement column to the given type in a single table rewrite."""
+    alterations = ', '.join(
+        f"ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}"
+        for column in MEASUREMENT_COLUMNS
+    )
+    # Altering the partitioned parent rewrites every partition
+    op.execute(f"ALTER TABLE mizu_sensor_hub {alterations}")
+
+
+def upgrade() -> None:
+    """Narrow the measurement columns to 4-byte real.
+
+    Sensor readings carry far less precision than real offers, and halving
+    the column width shrinks rows, WAL volume and scan I/O.
+    """
+    _set_measurement_type('real')
+
+
+def downgrade() -> None:
+    """Widen the measurement columns back to double precision."""
+    _set_measurement_type('double precision')
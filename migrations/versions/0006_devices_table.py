@@ -0,0 +1,65 @@
+"""Move device identifiers into a devices table
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace mizu_sensor_hub.device_id with a SMALLINT reference to devices.
+
+    Readings come from a handful of devices, so storing each identifier
+    once and referencing it by a 2-byte id keeps the sensor rows and the
+    device index much smaller than repeating the string in every row.
+    """
+    op.create_table(
+        'devices',
+        sa.Column('id', sa.SmallInteger(), autoincrement=True, nullable=False),
+        sa.Column('device_id', sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('device_id')
+    )
+    op.execute(
+        "INSERT INTO devices (device_id) "
+        "SELECT DISTINCT device_id FROM mizu_sensor_hub ORDER BY device_id"
+    )
+
+    op.add_column('mizu_sensor_hub', sa.Column('device_ref', sa.SmallInteger(), nullable=True))
+    op.execute(
+        "UPDATE mizu_sensor_hub SET device_ref = devices.id "
+        "FROM devices WHERE devices.device_id = mizu_sensor_hub.device_id"
+    )
+    op.alter_column('mizu_sensor_hub', 'device_ref', nullable=False)
+    op.create_foreign_key(
+        'mizu_sensor_hub_device_ref_fkey', 'mizu_sensor_hub', 'devices', ['device_ref'], ['id']
+    )
+    op.create_index('ix_mizu_sensor_hub_device_ref', 'mizu_sensor_hub', ['device_ref'], unique=False)
+
+    op.drop_index('ix_mizu_sensor_hub_device_id', table_name='mizu_sensor_hub')
+    op.drop_column('mizu_sensor_hub', 'device_id')
+
+
+def downgrade() -> None:
+    """Copy the device identifiers back into mizu_sensor_hub and drop devices."""
+    op.add_column('mizu_sensor_hub', sa.Column('device_id', sa.String(length=100), nullable=True))
+    op.execute(
+        "UPDATE mizu_sensor_hub SET device_id = devices.device_id "
+        "FROM devices WHERE devices.id = mizu_sensor_hub.device_ref"
+    )
+    op.alter_column('mizu_sensor_hub', 'device_id', nullable=False)
+    op.create_index('ix_mizu_sensor_hub_device_id', 'mizu_sensor_hub', ['device_id'], unique=False)
+
+    # Dropping the column also drops its foreign key and index
+    op.drop_column('mizu_sensor_hub', 'device_ref')
+    op.drop_table('devices')
@@ -13,18 +13,25 @@ The application features:
 - Light/Dark theme switching
 """
 
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 import customtkinter
 
 from config import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, DEFAULT_THEME,
     DEFAULT_COLOR_THEME, EXIT_CONFIRMATION_MESSAGE, DIALOG_TITLES,
-    DATABASE_CONFIG, DATABASE_URL_TEMPLATE
+    DATABASE_URL, LOG_LEVEL, LOG_FORMAT
 )
 from serial_manager import SerialManager
 from ui_components import NavigationBar, ConnectionPanel, MainContentPanel
 from error_handler import ErrorHandler
 from database_manager import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
 
 class MizuSensorHub(customtkinter.CTk):
     """
@@ -53,14 +60,17 @@ class MizuSensorHub(customtkinter.CTk):
         self.error_handler = ErrorHandler()
 
         # Initialize database manager
-        database_url = DATABASE_URL_TEMPLATE.format(**DATABASE_CONFIG)
-        self.database_manager = DatabaseManager(database_url)
+        self.database_manager = DatabaseManager(DATABASE_URL)
+
+        # Close the port and flush buffered data at interpreter exit even if the
+        # window is never closed; atexit runs handlers in reverse, so the port
+        # stops delivering lines before the final flush
+        atexit.register(self.database_manager.close)
+        atexit.register(self.serial_manager.cleanup)
 
         # Initialize database connection
         if not self.database_manager.initialize():
-            print("Warning: Database initialization failed. Sensor data will not be saved.")
-        else:
-            print("Database initialized successfully. Sensor data will be saved.")
+            logger.warning("Database initialization failed. Sensor data will not be saved.")
 
         # Setup the main application window and components
         self._configure_main_window()
@@ -138,16 +148,17 @@ class MizuSensorHub(customtkinter.CTk):
         """
         Scan for available serial ports.
 
+        Called from the connection panel's background scan thread, so
+        the warning dialog is shown from the main thread.
+
         Returns:
             List of available serial port names
         """
         try:
             return self.serial_manager.scan_available_ports()
         except Exception as error:
-            self.error_handler.show_warning(
-                "Port Scan Error",
-                f"Failed to scan for available ports: {error}"
-            )
+            message = f"Failed to scan for available ports: {error}"
+            self.after(0, lambda: self.error_handler.show_warning("Port Scan Error", message))
             return []
 
     def _toggle_serial_connection(self) -> None:
@@ -220,24 +231,27 @@ class MizuSensorHub(customtkinter.CTk):
             # Clear command input on successful send
             self.main_content_panel.clear_command_input()
 
-    def _handle_received_data(self, data: str) -> None:
+    def _handle_received_data(self, data: bytes) -> None:
         """
         Handle data received from the serial connection.
 
         This method is called by the serial manager when new data
-        is received. It updates the UI display in a thread-safe manner
-        and saves the data to the database.
+        is received. It queues the data for the UI display, which is
+        updated in the main thread, and saves the data to the database.
 
         Args:
-            data: The received data string
+            data: The received data line, as raw bytes
         """
-        # Parse and format the sensor data for display
-        formatted_data = self._format_sensor_data_for_display(data)
+        # Parse and format the sensor data for display; only the display
+        # needs text, the database parser takes the raw bytes
+        formatted_data = self._format_sensor_data_for_display(
+            data.decode('utf-8', errors='ignore')
+        )
 
-        # Update the data display in the main thread
-        self.after(0, self.main_content_panel.update_data_display, formatted_data)
+        # The panel batches lines and paints them on its next refresh
+        self.main_content_panel.update_data_display(formatted_data)
 
-        # Save sensor data to database
+        # Queue the line; the database flusher parses and writes it in batches
         if hasattr(self, 'database_manager'):
             self.database_manager.save_sensor_data(data)
 
@@ -328,8 +342,8 @@ class MizuSensorHub(customtkinter.CTk):
         if self.serial_manager.is_connected:
             try:
                 self._close_serial_connection()
-            except Exception as cleanup_error:
-                print(f"Error during connection cleanup: {cleanup_error}")
+            except Exception:
+                logger.exception("Error during connection cleanup")
 
         # Ask user for confirmation before closing
         user_confirmation = self.error_handler.ask_confirmation(
@@ -350,22 +364,36 @@ class MizuSensorHub(customtkinter.CTk):
         # Clean up serial manager
         self.serial_manager.cleanup()
 
+        # Write any buffered sensor data before exiting
+        self.database_manager.close()
+
         # Destroy the main window
         self.destroy()
 
-    def __del__(self) -> None:
-        """
-        Destructor to ensure cleanup when object is garbage collected.
 
-        Provides a safety net to ensure resources are properly
-        released even if the object is not explicitly destroyed.
-        """
-        try:
-            if hasattr(self, 'serial_manager'):
-                self.serial_manager.cleanup()
-        except Exception:
-            # Ignore errors during cleanup in destructor
-            pass
+def _configure_logging() -> QueueListener:
+    """
+    Configure logging once for the whole application.
+
+    Records are handed to a queue and written to the console by a
+    background listener thread, so logging from the serial monitor
+    or the UI thread never waits on console output.
+
+    Returns:
+        The started listener, to be stopped on exit
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(LOG_LEVEL)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    listener.start()
+    return listener
 
 
 def main() -> None:
@@ -375,11 +403,17 @@ def main() -> None:
     Creates and starts the main application window, beginning
     the event loop that handles user interactions.
     """
-    # Create the main application instance
-    sensor_hub_app = MizuSensorHub()
+    log_listener = _configure_logging()
+
+    try:
+        # Create the main application instance
+        sensor_hub_app = MizuSensorHub()
 
-    # Start the main event loop
-    sensor_hub_app.mainloop()
+        # Start the main event loop
+        sensor_hub_app.mainloop()
+    finally:
+        # Write out any records still queued
+        log_listener.stop()
 
 
 if __name__ == "__main__":
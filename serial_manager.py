@@ -5,16 +5,32 @@ This module handles all serial port operations including connection
 management, data transmission, and port discovery.
 """
 
-import sys
+import logging
+import os
 import threading
 from typing import List, Optional, Callable
 import serial
 
+try:
+    from serial.tools import list_ports
+except ImportError:
+    # pyserial has no port enumerator for this platform
+    list_ports = None
+
 from config import (
-    SERIAL_TIMEOUT, MAX_COM_PORTS, OS_WINDOWS, OS_LINUX,
+    SERIAL_TIMEOUT, SERIAL_RX_BUFFER_SIZE, SERIAL_MONITOR_CPU, SERIAL_MONITOR_RT_PRIORITY,
+    OS_WINDOWS, OS_LINUX,
     ERROR_MESSAGES, SUCCESS_MESSAGES
 )
 
+logger = logging.getLogger(__name__)
+
+# Longest partial line kept while waiting for its newline; longer input is discarded
+_MAX_LINE_LENGTH = 65536
+
+# Seconds disconnect() waits for the monitor thread to exit before closing the port
+_MONITOR_JOIN_TIMEOUT = 0.5
+
 
 class SerialManager:
     """
@@ -32,16 +48,18 @@ class SerialManager:
         """
         self.serial_connection: Optional[serial.Serial] = None
         self.is_connected = False
-        self.should_monitor_data = False
+        # Set to ask the monitor thread to exit
+        self._stop_event = threading.Event()
         self.data_monitoring_thread: Optional[threading.Thread] = None
-        self.data_callback: Optional[Callable[[str], None]] = None
+        self.data_callback: Optional[Callable[[bytes], None]] = None
 
-    def set_data_callback(self, callback: Callable[[str], None]) -> None:
+    def set_data_callback(self, callback: Callable[[bytes], None]) -> None:
         """
         Set the callback function for received data.
 
         Args:
-            callback: Function to call when data is received
+            callback: Function to call with each received line, as raw
+                bytes without the trailing newline
         """
         self.data_callback = callback
 
@@ -49,33 +67,19 @@ class SerialManager:
         """
         Scan the system for available serial ports.
 
+        The ports are listed by the operating system's device enumerator,
+        so no port has to be opened to find out whether it exists.
+
         Returns:
             List of available serial port names.
 
         Raises:
             EnvironmentError: When running on an unsupported platform.
         """
-        if sys.platform.startswith('win'):
-            port_list = [f'COM{port_number + 1}' for port_number in range(MAX_COM_PORTS)]
-        elif sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
-            import glob
-            port_list = glob.glob('/dev/tty[A-Za-z]*')
-        elif sys.platform.startswith('darwin'):
-            import glob
-            port_list = glob.glob('/dev/tty.*')
-        else:
+        if list_ports is None:
             raise EnvironmentError(ERROR_MESSAGES["unsupported_platform"])
 
-        available_ports = []
-        for port_name in port_list:
-            try:
-                test_connection = serial.Serial(port_name)
-                test_connection.close()
-                available_ports.append(port_name)
-            except (OSError, serial.SerialException):
-                continue
-
-        return available_ports
+        return [port_info.device for port_info in list_ports.comports()]
 
     def connect(self, port: str, baud_rate: int, os_type: int) -> bool:
         """
@@ -95,10 +99,12 @@ class SerialManager:
                 self.serial_connection = serial.Serial(
                     full_port_path, baud_rate, timeout=SERIAL_TIMEOUT
                 )
+                self._enable_low_latency(self.serial_connection)
             elif os_type == OS_WINDOWS:
                 self.serial_connection = serial.Serial(
                     port, baud_rate, timeout=SERIAL_TIMEOUT
                 )
+                self._enlarge_receive_buffer(self.serial_connection)
             else:
                 return False
 
@@ -113,15 +119,31 @@ class SerialManager:
     def disconnect(self) -> None:
         """
         Close the serial connection and stop data monitoring.
+
+        A read blocked in the monitor thread is cancelled, so the thread
+        exits at once instead of after the read timeout, and the port is
+        only closed once the thread has stopped using it.
         """
-        self.should_monitor_data = False
+        self._stop_event.set()
+
+        if self.serial_connection:
+            try:
+                self.serial_connection.cancel_read()
+            except (AttributeError, serial.SerialException, OSError):
+                # Not supported on this platform; the read timeout ends it instead
+                pass
+
+        thread = self.data_monitoring_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(_MONITOR_JOIN_TIMEOUT)
+        self.data_monitoring_thread = None
 
         if self.serial_connection:
             try:
                 self.serial_connection.close()
-                print(SUCCESS_MESSAGES["connection_closed"])
+                logger.info(SUCCESS_MESSAGES["connection_closed"])
             except serial.SerialException as close_error:
-                print(f"Error while closing connection: {close_error}")
+                logger.warning("Error while closing connection: %s", close_error)
             finally:
                 self.serial_connection = None
 
@@ -142,16 +164,75 @@ class SerialManager:
 
         try:
             self.serial_connection.write(command.encode())
-            print(SUCCESS_MESSAGES["command_sent"].format(command=command))
+            logger.info(SUCCESS_MESSAGES["command_sent"], command)
             return True
         except serial.SerialException:
             return False
 
+    @staticmethod
+    def _enable_low_latency(connection: serial.Serial) -> None:
+        """
+        Ask the Linux serial driver to deliver received bytes immediately.
+
+        USB adapters such as FTDI otherwise hold bytes for up to 16 ms
+        before passing them on. Drivers without the setting are left as is.
+
+        Args:
+            connection: The open serial connection
+        """
+        try:
+            connection.set_low_latency_mode(True)
+        except (AttributeError, ValueError, OSError):
+            pass
+
+    @staticmethod
+    def _enlarge_receive_buffer(connection: serial.Serial) -> None:
+        """
+        Ask the Windows serial driver for a larger receive buffer.
+
+        Bursts then wait in the driver until the monitor thread drains
+        them in one read, instead of overrunning the default 4 KiB buffer.
+
+        Args:
+            connection: The open serial connection
+        """
+        try:
+            connection.set_buffer_size(rx_size=SERIAL_RX_BUFFER_SIZE)
+        except (AttributeError, ValueError, serial.SerialException):
+            pass
+
+    @staticmethod
+    def _raise_monitor_priority() -> None:
+        """
+        Pin the calling thread to SERIAL_MONITOR_CPU and run it as SCHED_FIFO.
+
+        Only available on Linux. Settings the process is not allowed to
+        use, such as real-time scheduling without CAP_SYS_NICE or a CPU
+        outside its affinity mask, are skipped.
+        """
+        if not hasattr(os, 'sched_setscheduler'):
+            return
+
+        # pid 0 applies the call to the calling thread only
+        if SERIAL_MONITOR_CPU is not None and SERIAL_MONITOR_CPU in os.sched_getaffinity(0):
+            try:
+                os.sched_setaffinity(0, {SERIAL_MONITOR_CPU})
+            except OSError as error:
+                logger.debug("Could not pin serial monitor thread: %s", error)
+
+        if SERIAL_MONITOR_RT_PRIORITY is not None:
+            try:
+                os.sched_setscheduler(
+                    0, os.SCHED_FIFO, os.sched_param(SERIAL_MONITOR_RT_PRIORITY)
+                )
+            except OSError as error:
+                logger.debug("Could not raise serial monitor thread priority: %s", error)
+
     def _start_data_monitoring(self) -> None:
         """
         Start the data monitoring thread.
         """
-        self.should_monitor_data = True
+        self._stop_event.clear()
         self.data_monitoring_thread = threading.Thread(target=self._monitor_data)
         self.data_monitoring_thread.daemon = True
         self.data_monitoring_thread.start()
@@ -161,22 +242,57 @@ class SerialManager:
         Monitor incoming data from the serial connection.
 
         This method runs in a separate thread and continuously reads
-        data from the serial port, calling the data callback when
-        new data is received.
+        data from the serial port, calling the data callback for each
+        complete line received. Lines are passed on undecoded, since the
+        database parser works on bytes.
+
+        Everything the driver has buffered is read in one call, and the
+        complete lines in it are split apart with a single split(),
+        instead of readline() fetching one byte at a time.
+        While nothing is waiting, read() sleeps until bytes arrive (in
+        select() on POSIX, or an overlapped wait on Windows) rather than
+        polling.
         """
-        while self.should_monitor_data and self.serial_connection:
-            try:
-                incoming_data = self.serial_connection.readline()
+        self._raise_monitor_priority()
+
+        connection = self.serial_connection
+        if connection is None:
+            return
+        received = bytearray()
 
-                if incoming_data and self.data_callback:
-                    decoded_data = incoming_data.decode('utf-8', errors='ignore')
-                    print(f"Received data: {decoded_data}")
-                    self.data_callback(decoded_data)
+        stop_event = self._stop_event
 
+        while not stop_event.is_set():
+            try:
+                # With nothing waiting, block for up to SERIAL_TIMEOUT on one byte
+                chunk = connection.read(connection.in_waiting or 1)
             except serial.SerialException:
                 break
-            except UnicodeDecodeError:
+            except (OSError, TypeError):
+                # The connection was closed from another thread
+                break
+
+            if not chunk:
                 continue
+            received += chunk
+
+            # Only the complete lines are taken; a trailing partial line
+            # stays buffered until its newline arrives
+            end = received.rfind(b'\n')
+            if end != -1:
+                # One copy of the complete lines; split() then yields each
+                # line as immutable bytes that the parse cache can hash
+                lines = bytes(received[:end]).split(b'\n')
+                del received[:end + 1]
+
+                callback = self.data_callback
+                if callback:
+                    for line in lines:
+                        logger.debug("Received data: %r", line)
+                        callback(line)
+
+            if len(received) > _MAX_LINE_LENGTH:
+                received.clear()
 
     def cleanup(self) -> None:
         """
@@ -6,121 +6,78 @@ This script helps users set up the PostgreSQL database and run
 initial migrations for the sensor data storage.
 """
 
-import os
 import sys
-import subprocess
-from config import DATABASE_CONFIG, DATABASE_URL_TEMPLATE
+
+import psycopg
+from psycopg import sql
+from alembic import command
+from alembic.config import Config
+
+from config import DATABASE_CONFIG, DATABASE_URL
+
+
+def connect_to_server():
+    """
+    Open an autocommit connection to the server's maintenance database.
+
+    CREATE DATABASE and DROP DATABASE cannot run inside a transaction,
+    so the connection is in autocommit mode.
+    """
+    return psycopg.connect(
+        host=DATABASE_CONFIG['host'],
+        port=DATABASE_CONFIG['port'],
+        user=DATABASE_CONFIG['username'],
+        password=DATABASE_CONFIG['password'],
+        dbname='postgres',
+        autocommit=True
+    )
 
 
 def check_postgresql_installed():
-    """Check if PostgreSQL is installed and accessible."""
+    """Check if the PostgreSQL server is running and accessible."""
     try:
-        result = subprocess.run(['psql', '--version'],
-                              capture_output=True, text=True, check=True)
-        print(f"PostgreSQL found: {result.stdout.strip()}")
+        with connect_to_server() as conn:
+            version = conn.info.parameter_status('server_version')
+        print(f"PostgreSQL found: server version {version}")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("PostgreSQL not found. Please install PostgreSQL first.")
+    except psycopg.Error as e:
+        print(f"PostgreSQL not reachable: {e}")
         return False
 
 
 def create_database():
-    """Create the database if it doesn't exist."""
+    """Create the database, dropping any existing one first."""
+    database = sql.Identifier(DATABASE_CONFIG['database'])
     try:
-        # First, drop the database if it exists (for fresh setup)
-        drop_db_cmd = [
-            'psql', '-h', DATABASE_CONFIG['host'],
-            '-p', str(DATABASE_CONFIG['port']),
-            '-U', DATABASE_CONFIG['username'],
-            '-c', f"DROP DATABASE IF EXISTS {DATABASE_CONFIG['database']};"
-        ]
-
-        # Set password environment variable
-        env = os.environ.copy()
-        env['PGPASSWORD'] = DATABASE_CONFIG['password']
-
-        # Drop existing database
-        drop_result = subprocess.run(drop_db_cmd, env=env,
-                                   capture_output=True, text=True)
-
-        if drop_result.returncode == 0:
+        with connect_to_server() as conn:
+            # First, drop the database if it exists (for fresh setup)
+            conn.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(database))
             print(f"Dropped existing database '{DATABASE_CONFIG['database']}' for fresh setup.")
-        else:
-            print(f"Note: {drop_result.stderr}")
-
-        # Create new database using template0 to avoid collation issues
-        create_db_cmd = [
-            'psql', '-h', DATABASE_CONFIG['host'],
-            '-p', str(DATABASE_CONFIG['port']),
-            '-U', DATABASE_CONFIG['username'],
-            '-c', f"CREATE DATABASE {DATABASE_CONFIG['database']} TEMPLATE template0;"
-        ]
 
-        result = subprocess.run(create_db_cmd, env=env,
-                              capture_output=True, text=True)
-
-        if result.returncode == 0:
+            # Create new database using template0 to avoid collation issues
+            conn.execute(sql.SQL("CREATE DATABASE {} TEMPLATE template0").format(database))
             print(f"Database '{DATABASE_CONFIG['database']}' created successfully using template0.")
             return True
-        else:
-            print(f"Failed to create database: {result.stderr}")
-            # Try alternative approach if the first one fails
-            return create_database_alternative()
-
-    except Exception as e:
-        print(f"Error creating database: {e}")
-        return False
-
-
-def create_database_alternative():
-    """Alternative method to create database using createdb command."""
-    try:
-        # Use createdb command which might handle collation issues better
-        create_db_cmd = [
-            'createdb', '-h', DATABASE_CONFIG['host'],
-            '-p', str(DATABASE_CONFIG['port']),
-            '-U', DATABASE_CONFIG['username'],
-            '--template=template0',
-            DATABASE_CONFIG['database']
-        ]
-
-        # Set password environment variable
-        env = os.environ.copy()
-        env['PGPASSWORD'] = DATABASE_CONFIG['password']
-
-        result = subprocess.run(create_db_cmd, env=env,
-                              capture_output=True, text=True)
-
-        if result.returncode == 0:
-            print(f"Database '{DATABASE_CONFIG['database']}' created successfully using createdb.")
-            return True
-        else:
-            print(f"Alternative database creation failed: {result.stderr}")
-            return False
 
-    except Exception as e:
-        print(f"Error in alternative database creation: {e}")
+    except psycopg.Error as e:
+        print(f"Failed to create database: {e}")
         return False
 
 
 def run_migrations():
     """Run Alembic migrations to create tables."""
     try:
-        # Update alembic.ini with the correct database URL
-        database_url = DATABASE_URL_TEMPLATE.format(**DATABASE_CONFIG)
+        # Point Alembic at the configured database rather than the URL in
+        # alembic.ini; ConfigParser needs '%' escaped
+        alembic_config = Config('alembic.ini')
+        alembic_config.set_main_option('sqlalchemy.url', DATABASE_URL.replace('%', '%%'))
 
-        # Run alembic upgrade
-        result = subprocess.run(['alembic', 'upgrade', 'head'],
-                              capture_output=True, text=True, check=True)
+        command.upgrade(alembic_config, 'head')
         print("Migrations completed successfully.")
-        print(result.stdout)
         return True
 
-    except subprocess.CalledProcessError as e:
-        print(f"Migration failed: {e.stderr}")
-        return False
     except Exception as e:
-        print(f"Error running migrations: {e}")
+        print(f"Migration failed: {e}")
         return False
 
 
@@ -128,8 +85,7 @@ def test_database_connection():
     """Test the database connection."""
     try:
         from database_models import init_database
-        database_url = DATABASE_URL_TEMPLATE.format(**DATABASE_CONFIG)
-        init_database(database_url)
+        init_database(DATABASE_URL)
         print("Database connection test successful.")
         return True
     except Exception as e:
@@ -144,7 +100,7 @@ def main():
 
     # Check PostgreSQL installation
     if not check_postgresql_installed():
-        print("\nPlease install PostgreSQL and ensure 'psql' is in your PATH.")
+        print("\nPlease install PostgreSQL and make sure the server is running.")
         print("Download from: https://www.postgresql.org/download/")
         return False
 
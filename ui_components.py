@@ -5,8 +5,19 @@ This module contains all GUI widget creation and management logic,
 separated from the main application logic for better maintainability.
 """
 
+# PERF NOTE: The costly work in this module is Tcl/Tk interpreter traffic
+# and geometry recomputation, not Python computation, so JIT compilers such
+# as Numba cannot speed it up and are not used here. Keep UI changes fast
+# by doing less Tk work instead: paint data in batches, keep grids flat,
+# cache widget state and keep blocking calls off the Tk thread. The
+# decision is recorded in CONTRIBUTING.md.
+
+import threading
 import tkinter as tk
+from collections import deque
 from tkinter import END, VERTICAL
+from tkinter import font as tkfont
+from typing import Dict, Optional
 import customtkinter
 
 from config import (
@@ -14,10 +25,43 @@ from config import (
     DEFAULT_COLOR_THEME, DEFAULT_FONT, DEFAULT_FONT_SIZE,
     TITLE_FONT, TITLE_FONT_SIZE, ICON_FONT, ICON_FONT_SIZE,
     ICON_COLOR, TITLE_COLOR, THEME_OPTIONS, OS_WINDOWS, OS_LINUX,
-    DEFAULT_BAUD_RATE
+    DEFAULT_BAUD_RATE, DISPLAY_REFRESH_INTERVAL_MS, DISPLAY_MAX_PENDING_LINES,
+    DISPLAY_MAX_LINES, DISPLAY_TRIM_INTERVAL
 )
 
 
+# Port dropdown entries shown while a scan runs and when it finds no ports
+_PORT_SCANNING = "Scanning..."
+_NO_PORTS = "(none)"
+
+# Shared font objects, created by get_fonts() on first use
+_fonts: Optional[Dict[str, tkfont.Font]] = None
+
+
+def get_fonts() -> Dict[str, tkfont.Font]:
+    """
+    Get the fonts shared by all widgets.
+
+    Each style is created once, so widgets share one Tk font instead of
+    each building its own from a tuple. The fonts are created on first
+    call because Tk fonts need an existing root window.
+
+    Returns:
+        Dictionary with "default", "title", "icon" and "data" fonts
+    """
+    global _fonts
+    if _fonts is None:
+        _fonts = {
+            "default": customtkinter.CTkFont(family=DEFAULT_FONT, size=DEFAULT_FONT_SIZE),
+            "title": customtkinter.CTkFont(family=TITLE_FONT, size=TITLE_FONT_SIZE, weight="bold"),
+            "icon": customtkinter.CTkFont(family=ICON_FONT, size=ICON_FONT_SIZE, weight="bold"),
+            # The data area is a plain tk.Listbox, which sizes fonts in points
+            # rather than CustomTkinter's scaled pixels
+            "data": tkfont.Font(family=DEFAULT_FONT, size=12)
+        }
+    return _fonts
+
+
 class NavigationBar:
     """Manages the top navigation bar with branding and controls."""
 
@@ -37,54 +81,80 @@ class NavigationBar:
 
     def _create_navigation_bar(self):
         """Create the navigation bar with all its components."""
-        # Create the main navigation bar container
+        # Create the main navigation bar container. Its height is fixed, so
+        # restyling the children (e.g. on a theme switch) does not make Tk
+        # re-measure the bar from its contents
         self.navigation_bar = customtkinter.CTkFrame(
-            master=self.parent, height=50, corner_radius=5
+            master=self.parent, height=60, corner_radius=5
         )
         self.navigation_bar.grid(
             row=0, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 5)
         )
+        self.navigation_bar.grid_propagate(False)
 
-        # Configure grid columns for proper element distribution
-        self.navigation_bar.grid_columnconfigure(0, weight=0)  # Icon - fixed width
-        self.navigation_bar.grid_columnconfigure(1, weight=1)  # Title - expands
-        self.navigation_bar.grid_columnconfigure(2, weight=0)  # Theme selector - fixed
-        self.navigation_bar.grid_columnconfigure(3, weight=0)  # Close button - fixed
+        # Icon, theme selector and close button keep their width; the title expands
+        for column, weight in enumerate((0, 1, 0, 0)):
+            self.navigation_bar.grid_columnconfigure(column, weight=weight)
+        # The single row fills the bar, centring the widgets vertically
+        self.navigation_bar.grid_rowconfigure(0, weight=1)
 
         self._create_app_icon()
         self._create_app_title()
         self._create_theme_selector()
         self._create_close_button()
 
+        # Place every widget in one pass
+        grid_specs = {
+            self.app_icon_label: {"column": 0, "padx": (10, 5), "sticky": "w"},
+            self.app_title_label: {"column": 1, "padx": (10, 10), "sticky": "w"},
+            self.theme_selector: {"column": 2, "padx": 10, "sticky": "e"},
+            self.close_app_button: {"column": 3, "padx": 10, "sticky": "e"}
+        }
+        for widget, spec in grid_specs.items():
+            widget.grid(row=0, pady=10, **spec)
+
     def _create_app_icon(self):
         """Create the application icon with satellite dish emoji."""
         self.app_icon_label = customtkinter.CTkLabel(
             master=self.navigation_bar,
             text="🤖",
-            font=(ICON_FONT, ICON_FONT_SIZE, "bold"),
+            font=get_fonts()["icon"],
             text_color=ICON_COLOR
         )
-        self.app_icon_label.grid(row=0, column=0, pady=10, padx=(10, 5), sticky="w")
 
     def _create_app_title(self):
         """Create the application title."""
         self.app_title_label = customtkinter.CTkLabel(
             master=self.navigation_bar,
             text=WINDOW_TITLE,
-            font=(TITLE_FONT, TITLE_FONT_SIZE, "bold"),
+            font=get_fonts()["title"],
             text_color=TITLE_COLOR
         )
-        self.app_title_label.grid(row=0, column=1, pady=10, padx=(10, 10), sticky="w")
 
     def _create_theme_selector(self):
         """Create the theme selection dropdown."""
         self.theme_selector = customtkinter.CTkOptionMenu(
             master=self.navigation_bar,
             values=THEME_OPTIONS,
-            command=self.theme_callback,
+            command=self._switch_theme,
             width=100
         )
-        self.theme_selector.grid(row=0, column=2, pady=10, padx=10, sticky="e")
+
+    def _switch_theme(self, selected_theme):
+        """
+        Run the theme callback between two idle-task flushes.
+
+        Pending layout work is finished first, so it does not interleave
+        with the recolouring of every widget, and the recoloured window
+        is then drawn in a single pass.
+
+        Args:
+            selected_theme: The theme chosen in the dropdown
+        """
+        root = self.navigation_bar.winfo_toplevel()
+        root.update_idletasks()
+        self.theme_callback(selected_theme)
+        root.update_idletasks()
 
     def _create_close_button(self):
         """Create the close application button."""
@@ -94,7 +164,6 @@ class NavigationBar:
             command=self.close_callback,
             width=80
         )
-        self.close_app_button.grid(row=0, column=3, pady=10, padx=10, sticky="e")
 
 
 class ConnectionPanel:
@@ -112,6 +181,13 @@ class ConnectionPanel:
         self.parent = parent
         self.connection_callback = connection_callback
         self.port_scan_callback = port_scan_callback
+        # Connection settings, kept up to date by widget events so reading
+        # them needs no Tcl calls
+        self._cached_os = OS_WINDOWS
+        self._cached_port = ""
+        self._cached_baud = DEFAULT_BAUD_RATE
+        # (text, state) last applied to the connection button
+        self._last_button_state = None
         self._create_connection_panel()
 
     def _create_connection_panel(self):
@@ -121,26 +197,28 @@ class ConnectionPanel:
             master=self.parent, corner_radius=5
         )
         self.connection_settings_panel.grid(row=1, column=0, sticky="nsw", padx=10, pady=10)
+        # All settings share this one grid, so Tk lays out a single container
+        self.connection_settings_panel.grid_columnconfigure(1, weight=1)
 
         self._create_os_selection_section()
-        self._create_serial_configuration_section()
+        # The serial settings are built when the panel is first shown, so
+        # they do not delay the window's first paint
+        self.connection_settings_panel.bind("<Map>", self._on_first_map, add="+")
+
+    def _on_first_map(self, event=None):
+        """Build the serial configuration section the first time the panel is shown."""
+        self.connection_settings_panel.unbind("<Map>")
+        if not hasattr(self, 'connection_control_button'):
+            self._create_serial_configuration_section()
 
     def _create_os_selection_section(self):
         """Create the operating system selection section."""
-        # Create container for OS selection
-        self.os_selection_frame = customtkinter.CTkFrame(
-            master=self.connection_settings_panel, height=60, corner_radius=5
-        )
-        self.os_selection_frame.grid(row=0, column=0, pady=10, padx=10, sticky="ew")
-        self.os_selection_frame.grid_columnconfigure(0, weight=1)
-        self.os_selection_frame.grid_columnconfigure(1, weight=1)
-
         # Create radio button variable to track selection
         self.selected_os = tk.IntVar()
 
         # Create Windows radio button
         self.windows_os_radio = customtkinter.CTkRadioButton(
-            master=self.os_selection_frame,
+            master=self.connection_settings_panel,
             variable=self.selected_os,
             value=OS_WINDOWS,
             text="Windows"
@@ -149,7 +227,7 @@ class ConnectionPanel:
 
         # Create Linux radio button
         self.linux_os_radio = customtkinter.CTkRadioButton(
-            master=self.os_selection_frame,
+            master=self.connection_settings_panel,
             variable=self.selected_os,
             value=OS_LINUX,
             text="Linux"
@@ -158,15 +236,18 @@ class ConnectionPanel:
 
         # Set Windows as default selection
         self.selected_os.set(OS_WINDOWS)
+        self.selected_os.trace_add(
+            "write", lambda *args: setattr(self, '_cached_os', self.selected_os.get())
+        )
 
     def _create_serial_configuration_section(self):
         """Create the serial port configuration section."""
-        # Create container for serial settings
-        self.serial_settings_frame = customtkinter.CTkFrame(
-            master=self.connection_settings_panel, corner_radius=5
+        # A thin line separates the OS choice from the serial settings; it
+        # holds no widgets, so it adds no layout pass of its own
+        self.section_separator = customtkinter.CTkFrame(
+            master=self.connection_settings_panel, height=2, corner_radius=0
         )
-        self.serial_settings_frame.grid(row=1, column=0, pady=10, padx=10, sticky="ew")
-        self.serial_settings_frame.grid_columnconfigure(1, weight=1)
+        self.section_separator.grid(row=1, column=0, columnspan=2, padx=10, sticky="ew")
 
         self._create_baud_rate_configuration()
         self._create_port_selection_configuration()
@@ -176,52 +257,95 @@ class ConnectionPanel:
         """Create the baud rate input field and label."""
         # Create baud rate label
         self.baud_rate_label = customtkinter.CTkLabel(
-            master=self.serial_settings_frame,
+            master=self.connection_settings_panel,
             height=30,
             text="Baud Rate",
-            font=(DEFAULT_FONT, DEFAULT_FONT_SIZE)
+            font=get_fonts()["default"]
         )
-        self.baud_rate_label.grid(row=0, column=0, pady=10, padx=10, sticky="w")
+        self.baud_rate_label.grid(row=2, column=0, pady=10, padx=10, sticky="w")
 
         # Create baud rate input field
+        self.baud_rate = tk.StringVar(value=DEFAULT_BAUD_RATE)
         self.baud_rate_input = customtkinter.CTkEntry(
-            master=self.serial_settings_frame, width=120, height=30
+            master=self.connection_settings_panel, width=120, height=30,
+            textvariable=self.baud_rate
+        )
+        self.baud_rate_input.grid(row=2, column=1, pady=10, padx=10, sticky="ew")
+        # Every edit, typed or pasted, writes the variable
+        self.baud_rate.trace_add(
+            "write", lambda *args: setattr(self, '_cached_baud', self.baud_rate.get())
         )
-        self.baud_rate_input.insert(0, DEFAULT_BAUD_RATE)
-        self.baud_rate_input.grid(row=0, column=1, pady=10, padx=10, sticky="ew")
 
     def _create_port_selection_configuration(self):
         """Create the serial port selection dropdown and label."""
         # Create port selection label
         self.port_selection_label = customtkinter.CTkLabel(
-            master=self.serial_settings_frame,
+            master=self.connection_settings_panel,
             height=30,
             text="PORT",
-            font=(DEFAULT_FONT, DEFAULT_FONT_SIZE)
+            font=get_fonts()["default"]
         )
-        self.port_selection_label.grid(row=1, column=0, pady=10, padx=10, sticky="w")
+        self.port_selection_label.grid(row=3, column=0, pady=10, padx=10, sticky="w")
 
-        # Get available serial ports and create dropdown
-        available_serial_ports = self.port_scan_callback()
+        # Create the dropdown empty; the ports are filled in by a background scan
         self.port_selection_dropdown = customtkinter.CTkOptionMenu(
-            master=self.serial_settings_frame,
+            master=self.connection_settings_panel,
             width=120,
             height=30,
-            values=available_serial_ports
+            values=[_PORT_SCANNING],
+            command=self._remember_port
         )
-        self.port_selection_dropdown.grid(row=1, column=1, pady=10, padx=10, sticky="ew")
+        self.port_selection_dropdown.grid(row=3, column=1, pady=10, padx=10, sticky="ew")
+        self.refresh_ports()
+
+    def refresh_ports(self):
+        """
+        Rescan the serial ports without blocking the UI.
+
+        The scan runs on a background thread, since enumerating ports
+        can take a noticeable time with some drivers, and the dropdown
+        is repopulated from the main thread when it finishes.
+        """
+        self.port_selection_dropdown.configure(values=[_PORT_SCANNING])
+        threading.Thread(target=self._scan_ports_in_background, daemon=True).start()
+
+    def _scan_ports_in_background(self):
+        """Run the port scan callback and hand the result to the main thread."""
+        ports = self.port_scan_callback()
+        self.port_selection_dropdown.after(0, lambda: self._show_ports(ports))
+
+    def _show_ports(self, ports):
+        """
+        Fill the port dropdown with scan results.
+
+        The selected port is kept if it is still available.
+
+        Args:
+            ports: Available serial port names
+        """
+        values = ports or [_NO_PORTS]
+        self.port_selection_dropdown.configure(values=values)
+        selected_port = self.port_selection_dropdown.get()
+        if selected_port not in values:
+            selected_port = values[0]
+            self.port_selection_dropdown.set(selected_port)
+        self._remember_port(selected_port)
+
+    def _remember_port(self, port):
+        """Cache the selected port; placeholder entries are not ports."""
+        self._cached_port = "" if port in (_PORT_SCANNING, _NO_PORTS) else port
 
     def _create_connection_control_button(self):
         """Create the main connection control button."""
         self.connection_control_button = customtkinter.CTkButton(
-            master=self.serial_settings_frame,
+            master=self.connection_settings_panel,
             height=35,
             text="Connect",
-            font=(DEFAULT_FONT, DEFAULT_FONT_SIZE),
+            font=get_fonts()["default"],
             command=self.connection_callback
         )
         self.connection_control_button.grid(
-            row=2, column=0, columnspan=2, pady=10, padx=10, sticky="ew"
+            row=4, column=0, columnspan=2, pady=10, padx=10, sticky="ew"
         )
 
     def update_connection_button_state(self, is_connected: bool):
@@ -231,23 +355,30 @@ class ConnectionPanel:
         Args:
             is_connected: Current connection status
         """
-        if is_connected:
-            self.connection_control_button.configure(text="Disconnect", state="normal")
-        else:
-            self.connection_control_button.configure(text="Connect", state="normal")
+        if not hasattr(self, 'connection_control_button'):
+            # Not shown yet; the button is created in the disconnected state
+            return
+
+        desired = ("Disconnect" if is_connected else "Connect", "normal")
+        # Skip the Tk round-trip and repaint when nothing changes
+        if desired == self._last_button_state:
+            return
+
+        text, state = desired
+        self.connection_control_button.configure(text=text, state=state)
+        self._last_button_state = desired
 
     def get_connection_settings(self):
         """
         Get the current connection settings.
 
+        The values are cached as the widgets change, so this makes no
+        Tcl calls.
+
         Returns:
             Tuple of (selected_os, selected_port, baud_rate)
         """
-        return (
-            self.selected_os.get(),
-            self.port_selection_dropdown.get(),
-            self.baud_rate_input.get()
-        )
+        return (self._cached_os, self._cached_port, self._cached_baud)
 
 
 class MainContentPanel:
@@ -263,6 +394,15 @@ class MainContentPanel:
         """
         self.parent = parent
         self.send_command_callback = send_command_callback
+
+        # Lines waiting to be painted, and whether a paint is scheduled
+        self._pending_lines: deque = deque(maxlen=DISPLAY_MAX_PENDING_LINES)
+        self._flush_scheduled = False
+        # Refreshes since old lines were last trimmed
+        self._flushes_since_trim = 0
+        # Whether the user has scrolled up from the latest data
+        self._user_scrolled = False
+
         self._create_main_content_panel()
 
     def _create_main_content_panel(self):
@@ -274,13 +414,27 @@ class MainContentPanel:
         self.main_content_panel.grid_rowconfigure(1, weight=1)
 
         self._create_command_input_section()
+        # The data display is built when the panel is first shown, so it
+        # does not delay the window's first paint
+        self.main_content_panel.bind("<Map>", self._on_first_map, add="+")
+
+    def _on_first_map(self, event=None):
+        """Build the data display section the first time the panel is shown."""
+        self.main_content_panel.unbind("<Map>")
+        if hasattr(self, 'data_display_listbox'):
+            return
+
         self._create_data_display_section()
+        # Paint any data that arrived before the section existed
+        if self._pending_lines:
+            self._schedule_flush()
 
     def _create_command_input_section(self):
         """Create the command input section with text field and send button."""
-        # Create container for command input
+        # Create container for command input. It is transparent, since the
+        # panel behind it already draws the background
         self.command_input_frame = customtkinter.CTkFrame(
-            master=self.main_content_panel, height=60, corner_radius=5
+            master=self.main_content_panel, height=60, corner_radius=5, fg_color="transparent"
         )
         self.command_input_frame.grid(row=0, column=0, pady=10, padx=10, sticky="ew")
         self.command_input_frame.grid_columnconfigure(0, weight=1)
@@ -297,41 +451,48 @@ class MainContentPanel:
             width=120,
             height=35,
             text="Send Command",
-            font=(DEFAULT_FONT, DEFAULT_FONT_SIZE),
+            font=get_fonts()["default"],
             command=self.send_command_callback
         )
         self.send_command_button.grid(row=0, column=1, pady=10, padx=10, sticky="e")
 
     def _create_data_display_section(self):
-        """Create the data display section with text area and scrollbar."""
-        # Create container for data display
+        """Create the data display section with list box and scrollbar."""
+        # Create container for data display, transparent like the command input's
         self.data_display_frame = customtkinter.CTkFrame(
-            master=self.main_content_panel, corner_radius=5
+            master=self.main_content_panel, corner_radius=5, fg_color="transparent"
         )
         self.data_display_frame.grid(row=1, column=0, pady=10, padx=10, sticky="nsew")
         self.data_display_frame.grid_columnconfigure(0, weight=1)
         self.data_display_frame.grid_rowconfigure(0, weight=1)
 
-        # Create text area for displaying received data
-        self.data_display_text_area = tk.Text(
+        # Create list box for displaying received data, one item per line.
+        # Unlike a Text widget it keeps plain strings in a flat array and
+        # only draws the visible rows, with no reflow on insert
+        self.data_display_listbox = tk.Listbox(
             self.data_display_frame,
-            font=(DEFAULT_FONT, 12),
-            padx=15,
-            pady=10
+            font=get_fonts()["data"],
+            activestyle="none"
         )
 
-        # Create vertical scrollbar for the text area
+        # Create vertical scrollbar for the list box
         self.data_display_scrollbar = tk.Scrollbar(
             self.data_display_frame,
             orient=VERTICAL,
-            command=self.data_display_text_area.yview
+            command=self.data_display_listbox.yview
         )
 
-        # Configure text area to use the scrollbar
-        self.data_display_text_area.configure(yscrollcommand=self.data_display_scrollbar.set)
+        # Configure list box to use the scrollbar
+        self.data_display_listbox.configure(yscrollcommand=self.data_display_scrollbar.set)
 
-        # Position the text area and scrollbar in the frame
-        self.data_display_text_area.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+        # Auto-scroll pauses while the user reads older data; wheel events
+        # are <MouseWheel> on Windows and macOS, <Button-4/5> on X11
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.data_display_listbox.bind(sequence, self._on_user_scroll, add="+")
+        self.data_display_scrollbar.bind("<ButtonRelease-1>", self._on_user_scroll, add="+")
+
+        # Position the list box and scrollbar in the frame
+        self.data_display_listbox.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         self.data_display_scrollbar.grid(row=0, column=1, sticky="ns", pady=10)
 
     def get_command_text(self) -> str:
@@ -349,11 +510,62 @@ class MainContentPanel:
 
     def update_data_display(self, data: str):
         """
-        Update the data display area with new data.
+        Queue new data for the data display area.
+
+        Lines are painted together at most once per refresh interval, so a
+        fast sensor cannot make Tk redraw and scroll the list box for
+        every line. Safe to call from the serial thread.
 
         Args:
             data: The data string to display
         """
-        # Add a newline before the new data to separate it from previous entries
-        self.data_display_text_area.insert(END, data + "\n")
-        self.data_display_text_area.see(END)  # Auto-scroll to show latest data
+        self._pending_lines.append(data)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Schedule a paint of the pending lines unless one is already scheduled."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.main_content_panel.after(DISPLAY_REFRESH_INTERVAL_MS, self._flush_data_display)
+
+    def _on_user_scroll(self, event=None):
+        """Check the scroll position once the user's scroll has been applied."""
+        self.data_display_listbox.after_idle(self._update_user_scrolled)
+
+    def _update_user_scrolled(self):
+        """Record whether the view has been scrolled up from the bottom."""
+        self._user_scrolled = self.data_display_listbox.yview()[1] < 0.999
+
+    def _flush_data_display(self):
+        """Paint all pending lines with one insert and at most one scroll."""
+        # Clear the flag first so lines queued from now on schedule another flush
+        self._flush_scheduled = False
+
+        pending_lines = self._pending_lines
+        if not pending_lines or not hasattr(self, 'data_display_listbox'):
+            # Lines queued before the display exists wait for _on_first_map
+            return
+        lines = [pending_lines.popleft() for _ in range(len(pending_lines))]
+
+        # Entries can span several lines; each line becomes one list item
+        listbox = self.data_display_listbox
+        listbox.insert(END, *"\n".join(lines).split("\n"))
+        self._flushes_since_trim += 1
+        if self._flushes_since_trim >= DISPLAY_TRIM_INTERVAL:
+            self._flushes_since_trim = 0
+            self._trim_data_display()
+
+        if not self._user_scrolled:
+            listbox.yview_moveto(1.0)  # Auto-scroll to show latest data
+
+    def _trim_data_display(self):
+        """
+        Drop the oldest lines so the widget's size and redraw cost stay bounded.
+
+        Runs only every DISPLAY_TRIM_INTERVAL refreshes, so the display may
+        briefly hold more than DISPLAY_MAX_LINES lines.
+        """
+        listbox = self.data_display_listbox
+        excess = listbox.size() - DISPLAY_MAX_LINES
+        if excess > 0:
+            listbox.delete(0, excess - 1)